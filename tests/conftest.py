@@ -2,12 +2,15 @@
 import os
 import json
 import platform
+import shutil
 import sys
 import pytest
 import uuid
 from selenium import webdriver
 from typing import Dict, Any, Generator
 
+from utilities.async_writer import AsyncArtifactWriter
+from utilities.browser_info import get_chrome_version
 from utilities.config_manager import ConfigManager
 from utilities.driver_factory import DriverFactory
 from utilities.logger import setup_logger
@@ -16,6 +19,15 @@ from utilities.screenshot_helper import ScreenshotHelper
 # Configure logging
 logger = setup_logger(__name__)
 
+# Output directories created at session start; only leaves are listed since
+# os.makedirs creates the 'reports' parent along the way
+_REQUIRED_DIRECTORIES = (
+    'logs',
+    'reports/html',
+    'reports/screenshots',
+    'reports/allure-results',
+)
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add custom pytest command line options."""
@@ -146,6 +158,29 @@ def pytest_runtest_makereport(item, call):
                 logger.error(f"Failed to take screenshot: {e}")
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    """Store screenshots of each test in its own folder."""
+    ScreenshotHelper.set_test_context(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: pytest.Item) -> Generator[None, None, None]:
+    """Finish pending screenshots and combine buffered steps into one attachment.
+
+    Asynchronous captures are awaited first, while the driver is still alive.
+    Steps buffered by any helper (the fixture's or a page object's) are
+    flushed. Steps buffered by fixture finalizers are flushed once the
+    fixtures are torn down, after which screenshots go back to the shared
+    folder so later ones are not filed under this test.
+    """
+    ScreenshotHelper.wait_for_captures()
+    ScreenshotHelper.flush_all_steps(item.name)
+    yield
+    ScreenshotHelper.flush_all_steps(item.name)
+    ScreenshotHelper.set_test_context(None)
+
+
 @pytest.fixture(scope="session")
 def test_data() -> Dict[str, Any]:
     """Load all test data and configurations using ConfigManager.
@@ -168,23 +203,27 @@ def pytest_configure(config: pytest.Config) -> None:
     )
 
     # Ensure required directories exist
-    directories = [
-        'logs',
-        'reports',
-        'reports/html',
-        'reports/screenshots',
-        'reports/allure-results'
-    ]
-
-    for directory in directories:
+    for directory in _REQUIRED_DIRECTORIES:
         try:
             os.makedirs(directory, exist_ok=True)
             logger.debug(f"Ensured directory exists: {directory}")
         except OSError as e:
             logger.warning(f"Could not create directory {directory}: {e}")
 
-    # Create Allure environment.properties and executor.json
-    _create_allure_environment_files()
+    # Create Allure environment.properties and executor.json once, in the
+    # controller process; xdist workers would only rewrite the same files
+    if not hasattr(config, 'workerinput'):
+        _create_allure_environment_files()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """Flush screenshots and error logs still queued for writing.
+
+    Runs before the report plugins so every artifact is on disk when the
+    HTML report is generated.
+    """
+    AsyncArtifactWriter().flush()
 
 
 def _create_allure_environment_files() -> None:
@@ -209,36 +248,11 @@ def _create_allure_environment_files() -> None:
 
         # Get browser version if available
         browser_version = "N/A"
-        try:
-            import subprocess
-            if default_browser.lower() == 'chrome':
-                # Try different Chrome executable paths based on OS
-                chrome_paths = []
-                if os_name == 'Darwin':  # macOS
-                    chrome_paths = [
-                        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
-                        'google-chrome'
-                    ]
-                elif os_name == 'Linux':
-                    chrome_paths = ['google-chrome',
-                                    'chromium-browser', 'chromium']
-                elif os_name == 'Windows':
-                    chrome_paths = [
-                        r'C:\Program Files\Google\Chrome\Application\chrome.exe',
-                        r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe'
-                    ]
-
-                for chrome_path in chrome_paths:
-                    try:
-                        result = subprocess.run([chrome_path, '--version'],
-                                                capture_output=True, text=True, timeout=2)
-                        if result.returncode == 0:
-                            browser_version = result.stdout.strip().split()[-1]
-                            break
-                    except (FileNotFoundError, subprocess.TimeoutExpired):
-                        continue
-        except Exception:
-            pass
+        if default_browser.lower() == 'chrome':
+            try:
+                browser_version = get_chrome_version() or "N/A"
+            except Exception:
+                pass
 
         # Write environment.properties
         env_file = os.path.join(allure_results_dir, 'environment.properties')
@@ -278,10 +292,9 @@ def _create_allure_environment_files() -> None:
         history_source = os.path.join(previous_report_dir, 'history')
         history_dest = os.path.join(allure_results_dir, 'history')
 
-        if os.path.exists(history_source):
+        if os.path.isdir(history_source):
             try:
-                import shutil
-                if os.path.exists(history_dest):
+                if os.path.isdir(history_dest):
                     shutil.rmtree(history_dest)
                 shutil.copytree(history_source, history_dest)
                 logger.debug(
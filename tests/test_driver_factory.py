@@ -0,0 +1,261 @@
+"""Unit tests for DriverFactory driver resolution.
+
+These tests cover the filesystem logic behind driver lookup (webdriver-manager
+cache and install-result cache). They use a temporary home directory and a fake
+browser binary, so no real browser or network access is needed.
+"""
+import json
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Generator, List
+
+import pytest
+
+from utilities.browser_info import get_chrome_version
+from utilities.driver_factory import DriverFactory
+from utilities.exceptions import DriverInitializationError
+
+
+def _make_executable(path: Path, content: str = "") -> str:
+    """Create an executable file, including missing parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return str(path)
+
+
+def _clear_caches() -> None:
+    """Reset the per-process memos so each test sees its own environment."""
+    get_chrome_version.cache_clear()
+    DriverFactory._resolve_driver_path.cache_clear()
+
+
+@pytest.fixture
+def fake_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Point the home directory and PATH at a temporary Linux x86_64 environment."""
+    home = tmp_path / "home"
+    home.mkdir()
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    monkeypatch.setattr("platform.machine", lambda: "x86_64")
+    _clear_caches()
+    yield home
+    _clear_caches()
+
+
+@pytest.fixture
+def fake_chrome(tmp_path: Path, fake_home: Path) -> Callable[[str], None]:
+    """Install a fake google-chrome binary that reports the given version."""
+    def install(version: str) -> None:
+        _make_executable(tmp_path / "bin" / "google-chrome",
+                         f"#!/bin/sh\necho 'Google Chrome {version}'\n")
+        _clear_caches()
+    return install
+
+
+class _FakeInstalls:
+    """Stand-in for webdriver-manager installs returning queued driver paths."""
+
+    def __init__(self):
+        self.results: List[str] = []
+        self.calls: List[str] = []
+
+    def get_driver_path(self, driver_manager, driver_name: str) -> str:
+        self.calls.append(driver_name)
+        if not self.results:
+            raise DriverInitializationError("offline")
+        return self.results.pop(0)
+
+
+@pytest.fixture
+def installs(monkeypatch: pytest.MonkeyPatch) -> _FakeInstalls:
+    """Replace webdriver-manager installs with queued results."""
+    fake = _FakeInstalls()
+    monkeypatch.setattr(DriverFactory, "_create_driver_manager", staticmethod(lambda name: None))
+    monkeypatch.setattr(DriverFactory, "_get_driver_path", staticmethod(fake.get_driver_path))
+    return fake
+
+
+def _cached_driver(home: Path, driver: str, platform_dir: str, version: str,
+                   executable: str = "") -> str:
+    """Create a driver inside the fake webdriver-manager cache."""
+    return _make_executable(home / ".wdm" / "drivers" / driver / platform_dir / version /
+                            (executable or driver))
+
+
+class TestFindCachedDriver:
+    """Tests for reusing drivers from the webdriver-manager cache."""
+
+    def test_matches_browser_major_version(self, fake_home: Path, fake_chrome):
+        """Only a chromedriver matching the installed Chrome major version is used."""
+        fake_chrome("121.0.6167.85")
+        _cached_driver(fake_home, "chromedriver", "linux64", "120.0.6099.109")
+        expected = _cached_driver(fake_home, "chromedriver", "linux64", "121.0.6167.85")
+
+        assert DriverFactory._find_cached_driver("chromedriver") == expected
+
+    def test_rejects_other_browser_versions(self, fake_home: Path, fake_chrome):
+        """A cache holding only older chromedrivers yields no match."""
+        fake_chrome("121.0.6167.85")
+        _cached_driver(fake_home, "chromedriver", "linux64", "120.0.6099.109")
+
+        assert DriverFactory._find_cached_driver("chromedriver") is None
+
+    def test_ignores_other_platforms(self, fake_home: Path):
+        """Drivers built for another OS or architecture are skipped."""
+        _cached_driver(fake_home, "geckodriver", "mac-arm64", "v0.35.0")
+        expected = _cached_driver(fake_home, "geckodriver", "linux64", "v0.34.0")
+
+        assert DriverFactory._find_cached_driver("geckodriver") == expected
+
+    def test_uses_exe_name_on_windows(self, fake_home: Path, monkeypatch: pytest.MonkeyPatch):
+        """On Windows the driver executable carries the .exe suffix."""
+        monkeypatch.setattr("platform.system", lambda: "Windows")
+        monkeypatch.setattr("platform.machine", lambda: "AMD64")
+        expected = _cached_driver(fake_home, "geckodriver", "win64", "v0.34.0", "geckodriver.exe")
+
+        assert DriverFactory._find_cached_driver("geckodriver") == expected
+
+    def test_without_cache_directory(self, fake_home: Path):
+        """No webdriver-manager cache means no cached driver."""
+        assert DriverFactory._find_cached_driver("geckodriver") is None
+
+
+class TestInstallDriver:
+    """Tests for the cross-run webdriver-manager install cache."""
+
+    def test_reuses_recent_install(self, fake_home: Path, fake_chrome, installs: _FakeInstalls):
+        """A fresh install result is reused without calling install() again."""
+        fake_chrome("120.0.6099.109")
+        installs.results.append(_make_executable(fake_home / "drivers" / "chromedriver-120"))
+
+        first = DriverFactory._install_driver("chromedriver")
+        second = DriverFactory._install_driver("chromedriver")
+
+        assert first == second
+        assert installs.calls == ["chromedriver"]
+
+    def test_browser_update_invalidates_install(self, fake_home: Path, fake_chrome,
+                                                installs: _FakeInstalls):
+        """After a Chrome update the driver for the old version is not served."""
+        fake_chrome("120.0.6099.109")
+        installs.results.append(_make_executable(fake_home / "drivers" / "chromedriver-120"))
+        DriverFactory._install_driver("chromedriver")
+
+        fake_chrome("121.0.6167.85")
+        driver_121 = _make_executable(fake_home / "drivers" / "chromedriver-121")
+        installs.results.append(driver_121)
+
+        assert DriverFactory._resolve_driver_path("chromedriver") == driver_121
+        assert len(installs.calls) == 2
+
+    def test_falls_back_to_stale_install_when_offline(self, fake_home: Path, fake_chrome,
+                                                      installs: _FakeInstalls,
+                                                      monkeypatch: pytest.MonkeyPatch):
+        """An expired entry is still used when install() fails."""
+        fake_chrome("120.0.6099.109")
+        driver_path = _make_executable(fake_home / "drivers" / "chromedriver-120")
+        installs.results.append(driver_path)
+        DriverFactory._install_driver("chromedriver")
+        monkeypatch.setattr("utilities.driver_factory._INSTALL_CACHE_TTL", 0)
+
+        assert DriverFactory._install_driver("chromedriver") == driver_path
+        assert len(installs.calls) == 2
+
+    @pytest.mark.parametrize("content", [
+        "[]",
+        "not json",
+        json.dumps({"geckodriver:Linux:x86_64": {"path": 1, "timestamp": "yesterday"}}),
+        json.dumps({"geckodriver:Linux:x86_64": ["path"]}),
+    ])
+    def test_ignores_malformed_cache(self, fake_home: Path, installs: _FakeInstalls, content: str):
+        """A damaged cache file does not break driver installation."""
+        cache_file = Path(DriverFactory._install_cache_file())
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text(content)
+        driver_path = _make_executable(fake_home / "drivers" / "geckodriver")
+        installs.results.append(driver_path)
+
+        assert DriverFactory._install_driver("geckodriver") == driver_path
+        assert json.loads(cache_file.read_text())["geckodriver:Linux:x86_64"]["path"] == driver_path
+
+    def test_forget_driver_path(self, fake_home: Path, installs: _FakeInstalls):
+        """A driver that failed to start a session is resolved afresh next time."""
+        broken = _make_executable(fake_home / "drivers" / "geckodriver-broken")
+        working = _make_executable(fake_home / "drivers" / "geckodriver-working")
+        installs.results.extend([broken, working])
+
+        assert DriverFactory._resolve_driver_path("geckodriver") == broken
+        DriverFactory._forget_driver_path(broken)
+
+        assert DriverFactory._resolve_driver_path("geckodriver") == working
+        assert os.path.isfile(DriverFactory._install_cache_file())
+
+    def test_parallel_installs_keep_every_entry(self, fake_home: Path, installs: _FakeInstalls,
+                                                monkeypatch: pytest.MonkeyPatch):
+        """Installs finishing in parallel threads all land in the cache file."""
+        results = {name: _make_executable(fake_home / "drivers" / name)
+                   for name in ("chromedriver", "geckodriver")}
+        monkeypatch.setattr(DriverFactory, "_get_driver_path",
+                            staticmethod(lambda manager, name: results[name]))
+
+        for _ in range(20):
+            Path(DriverFactory._install_cache_file()).unlink(missing_ok=True)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(DriverFactory._install_driver, results))
+
+            cache = json.loads(Path(DriverFactory._install_cache_file()).read_text())
+            assert sorted(entry["path"] for entry in cache.values()) == sorted(results.values())
+        assert not list(Path(DriverFactory._install_cache_file()).parent.glob("*.tmp"))
+
+
+class _FakeSession:
+    """Stand-in for a WebDriver session recording quit() calls."""
+
+    def __init__(self, browser: str):
+        self.browser = browser
+        self.quit_called = False
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+class TestCreateDriversParallel:
+    """Tests for launching several browsers at once."""
+
+    @pytest.fixture
+    def launched(self, monkeypatch: pytest.MonkeyPatch) -> List[_FakeSession]:
+        """Replace create_driver with fake sessions; a 'broken' browser fails to start."""
+        sessions: List[_FakeSession] = []
+
+        def create_driver(browser: str, headless: bool = False, browser_config=None) -> _FakeSession:
+            if browser == "broken":
+                raise DriverInitializationError("broken browser")
+            session = _FakeSession(browser)
+            sessions.append(session)
+            return session
+
+        monkeypatch.setattr(DriverFactory, "create_driver", staticmethod(create_driver))
+        return sessions
+
+    def test_returns_driver_per_browser(self, launched: List[_FakeSession]):
+        """Every requested browser gets its own session."""
+        drivers = DriverFactory.create_drivers_parallel(["chrome", "firefox"])
+
+        assert {browser: driver.browser for browser, driver in drivers.items()} == {
+            "chrome": "chrome", "firefox": "firefox"}
+        assert not any(session.quit_called for session in launched)
+
+    def test_quits_started_browsers_when_one_fails(self, launched: List[_FakeSession]):
+        """Browsers that did start are quit before the launch error is raised."""
+        with pytest.raises(DriverInitializationError, match="broken browser"):
+            DriverFactory.create_drivers_parallel(["chrome", "broken", "firefox"])
+
+        assert sorted(session.browser for session in launched) == ["chrome", "firefox"]
+        assert all(session.quit_called for session in launched)
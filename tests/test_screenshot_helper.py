@@ -0,0 +1,223 @@
+"""Unit tests for ScreenshotHelper artifact handling.
+
+These tests cover the screenshot file handling (background writes, duplicate
+linking, per-test folders and step sheets). They use a fake driver that returns
+fixed PNG bytes and a temporary screenshot directory, so no real browser is needed.
+"""
+import contextlib
+import hashlib
+import os
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Generator, List, Tuple
+
+import pytest
+
+import utilities.screenshot_helper as screenshot_module
+from utilities.async_writer import AsyncArtifactWriter
+from utilities.screenshot_helper import ScreenshotHelper
+
+
+class _FakeDriver:
+    """Stand-in for a WebDriver session returning fixed screenshot bytes."""
+
+    def __init__(self, png: bytes = b"fake png"):
+        self.png = png
+
+    def get_screenshot_as_png(self) -> bytes:
+        return self.png
+
+
+class _FakeAllure:
+    """Stand-in for the allure module recording attachments."""
+
+    attachment_type = SimpleNamespace(PNG="png", TEXT="text")
+
+    def __init__(self):
+        self.attachments: List[Tuple[bytes, str]] = []
+
+    def attach(self, body: bytes, name: str, attachment_type: Any) -> None:
+        self.attachments.append((body, name))
+
+    def step(self, title: str) -> contextlib.nullcontext:
+        return contextlib.nullcontext()
+
+
+@pytest.fixture
+def screenshot_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Save screenshots to a temporary directory with optimization off."""
+    monkeypatch.setattr(screenshot_module, "_SCREENSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(ScreenshotHelper, "_dir_prefix", str(tmp_path) + os.sep)
+    monkeypatch.setattr(ScreenshotHelper, "_step_helpers", [])
+    monkeypatch.setattr(ScreenshotHelper, "_seen", {})
+    monkeypatch.setattr(screenshot_module, "_OPTIMIZE_PNG", False)
+    return tmp_path
+
+
+@pytest.fixture
+def fake_allure(monkeypatch: pytest.MonkeyPatch) -> _FakeAllure:
+    """Replace the lazily imported allure module."""
+    fake = _FakeAllure()
+    monkeypatch.setattr(screenshot_module, "_ALLURE", fake)
+    return fake
+
+
+class TestDuplicateScreenshots:
+    """Tests for linking identical captures instead of writing them again."""
+
+    def test_identical_captures_are_hard_linked(self, screenshot_dir: Path):
+        """Each capture keeps its own file, sharing the content of the first."""
+        helper = ScreenshotHelper(_FakeDriver())
+
+        first = helper.take_screenshot("home")
+        second = helper.take_screenshot("home")
+
+        assert first != second
+        assert Path(second).read_bytes() == b"fake png"
+        assert os.path.samefile(first, second)
+
+    def test_identical_captures_linked_across_helpers(self, screenshot_dir: Path):
+        """A rerun's helper links to the file saved by the first attempt's helper."""
+        ScreenshotHelper.set_test_context("tests/test_example.py::test_login")
+        first = ScreenshotHelper(_FakeDriver()).take_screenshot("attempt")
+        ScreenshotHelper.set_test_context("tests/test_example.py::test_logout")
+        second = ScreenshotHelper(_FakeDriver()).take_screenshot("attempt")
+
+        assert Path(first).parent != Path(second).parent
+        assert os.path.samefile(first, second)
+
+    def test_different_captures_are_separate_files(self, screenshot_dir: Path):
+        """Captures with different content are written independently."""
+        driver = _FakeDriver(b"first")
+        helper = ScreenshotHelper(driver)
+
+        first = helper.take_screenshot("page")
+        driver.png = b"second"
+        second = helper.take_screenshot("page")
+
+        assert not os.path.samefile(first, second)
+        assert Path(second).read_bytes() == b"second"
+
+
+class TestPendingWrites:
+    """Tests for consumers of files still queued on the artifact writer."""
+
+    @pytest.fixture
+    def gate(self, monkeypatch: pytest.MonkeyPatch) -> Generator[threading.Event, None, None]:
+        """Hold queued screenshot writes on the writer thread until the event is set."""
+        gate = threading.Event()
+
+        def held_transform(png: bytes) -> bytes:
+            gate.wait(timeout=10)
+            return png
+
+        monkeypatch.setattr(screenshot_module, "_OPTIMIZE_PNG", True)
+        monkeypatch.setattr(screenshot_module, "_optimize_png", held_transform)
+        yield gate
+        gate.set()
+        AsyncArtifactWriter().flush()
+
+    def test_file_available_while_pending(self, screenshot_dir: Path, gate: threading.Event):
+        """A queued file counts as available before it reaches disk."""
+        helper = ScreenshotHelper(_FakeDriver())
+        path = helper._persist(b"queued", str(screenshot_dir / "queued.png"))
+
+        assert not os.path.isfile(path)
+        assert helper._file_available(path)
+        assert not helper._file_available(str(screenshot_dir / "missing.png"))
+
+    def test_attach_to_allure_waits_for_write(self, screenshot_dir: Path, gate: threading.Event,
+                                              fake_allure: _FakeAllure):
+        """Attaching a queued file by path reads it once the write has finished."""
+        helper = ScreenshotHelper(_FakeDriver())
+        path = helper._persist(b"queued", str(screenshot_dir / "queued.png"))
+        threading.Timer(0.1, gate.set).start()
+
+        helper.attach_to_allure(path, "Queued", fake_allure.attachment_type.PNG)
+
+        assert fake_allure.attachments == [(b"queued", "Queued")]
+
+    def test_take_screenshot_returns_written_file(self, screenshot_dir: Path,
+                                                  gate: threading.Event):
+        """take_screenshot() only returns once its file exists."""
+        helper = ScreenshotHelper(_FakeDriver())
+        threading.Timer(0.1, gate.set).start()
+
+        assert os.path.isfile(helper.take_screenshot("sync"))
+
+
+class TestFailedWrites:
+    """Tests for background writes that could not be completed."""
+
+    @pytest.fixture
+    def broken_helper(self, screenshot_dir: Path) -> ScreenshotHelper:
+        """Helper whose screenshot directory path is taken by a regular file."""
+        blocker = screenshot_dir / "blocker"
+        blocker.write_text("not a directory")
+        helper = ScreenshotHelper(_FakeDriver())
+        helper.screenshot_dir = str(blocker)
+        return helper
+
+    def test_failed_write_is_not_available(self, broken_helper: ScreenshotHelper):
+        """A queued file whose write failed is no longer reported as available."""
+        path = broken_helper._persist(b"lost", broken_helper._build_path("", "lost", "0"))
+        AsyncArtifactWriter().flush()
+
+        assert not broken_helper._file_available(path)
+        assert broken_helper.attach_to_html_report(path) is None
+        assert AsyncArtifactWriter()._errors == {}
+
+    def test_take_screenshot_raises_on_failed_write(self, broken_helper: ScreenshotHelper):
+        """take_screenshot() reports a write error to the caller."""
+        with pytest.raises(OSError):
+            broken_helper.take_screenshot("lost")
+
+
+class TestTestContext:
+    """Tests for routing screenshots to per-test folders."""
+
+    def test_routes_to_hashed_folder_and_back(self, screenshot_dir: Path):
+        """Files go to the test's hashed folder, then back to the shared folder."""
+        helper = ScreenshotHelper(_FakeDriver())
+        nodeid = "tests/test_example.py::test_login"
+        folder = hashlib.blake2s(nodeid.encode('utf-8'), digest_size=8).hexdigest()
+
+        ScreenshotHelper.set_test_context(nodeid)
+        in_test = helper.take_screenshot("login")
+        ScreenshotHelper.set_test_context(None)
+        after_test = helper.take_screenshot("login")
+
+        assert Path(in_test).parent == screenshot_dir / folder
+        assert Path(after_test).parent == screenshot_dir
+
+    def test_helper_directory_overrides_test_folder(self, screenshot_dir: Path):
+        """A directory set on one helper wins over the per-test folder for that helper only."""
+        own = ScreenshotHelper(_FakeDriver())
+        other = ScreenshotHelper(_FakeDriver(b"other"))
+        own.screenshot_dir = str(screenshot_dir / "custom")
+
+        ScreenshotHelper.set_test_context("tests/test_example.py::test_login")
+
+        assert Path(own.take_screenshot("own")).parent == screenshot_dir / "custom"
+        assert Path(other.take_screenshot("other")).parent != screenshot_dir / "custom"
+        own.screenshot_dir = None
+        assert own.screenshot_dir == other.screenshot_dir
+
+
+class TestStepScreenshots:
+    """Tests for buffered step screenshots."""
+
+    def test_flush_all_steps_without_pillow(self, screenshot_dir: Path, fake_allure: _FakeAllure,
+                                            monkeypatch: pytest.MonkeyPatch):
+        """Without Pillow each step is attached on its own and no sheet is saved."""
+        monkeypatch.setitem(sys.modules, "PIL", None)
+        helper = ScreenshotHelper(_FakeDriver())
+        helper.buffer_step("open")
+        helper.buffer_step("submit")
+
+        assert ScreenshotHelper.flush_all_steps("test_form") == []
+        assert [name for _, name in fake_allure.attachments] == ["Step - open", "Step - submit"]
+        assert ScreenshotHelper._step_helpers == []
+        assert not list(screenshot_dir.glob("steps_*"))
@@ -0,0 +1,162 @@
+"""Background writer for test artifacts.
+
+This module provides a process-wide writer that persists screenshots and error
+logs on a background thread, so the test thread does not block on disk I/O.
+Pending writes are flushed at the end of the pytest session.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['AsyncArtifactWriter']
+
+
+class AsyncArtifactWriter:
+    """Singleton that writes artifact bytes to disk from a background thread."""
+
+    _instance: Optional['AsyncArtifactWriter'] = None
+    _initialized: bool = False
+
+    def __new__(cls):
+        """Create singleton instance."""
+        if cls._instance is None:
+            cls._instance = super(AsyncArtifactWriter, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the writer and start its worker thread.
+
+        This is a singleton class, so the worker thread is started only once
+        per process.
+        """
+        if not self._initialized:
+            self._queue: queue.Queue = queue.Queue()
+            # Path -> event set once its write has finished
+            self._pending: Dict[str, threading.Event] = {}
+            # Path -> error of a failed write, kept until wait() or flush() reports it
+            self._errors: Dict[str, Exception] = {}
+            # Paths whose latest write failed
+            self._failed: Set[str] = set()
+            self._lock = threading.Lock()
+            self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+            self._thread.start()
+            # Make sure queued artifacts reach disk even without a pytest session
+            atexit.register(self.flush)
+            AsyncArtifactWriter._initialized = True
+            logger.debug("AsyncArtifactWriter started")
+
+    def submit(self, path: str, data: bytes,
+               transform: Optional[Callable[[bytes], bytes]] = None,
+               link_source: Optional[str] = None) -> None:
+        """Queue bytes to be written to a file.
+
+        Args:
+            path: Destination file path
+            data: File content
+            transform: Optional function applied to the content on the worker
+                thread before writing (e.g. PNG optimization)
+            link_source: Optional earlier artifact with identical content. The
+                destination is hard-linked to it, and the content is only
+                written if linking fails.
+        """
+        with self._lock:
+            self._pending[path] = threading.Event()
+            self._errors.pop(path, None)
+            self._failed.discard(path)
+        self._queue.put((path, data, transform, link_source))
+
+    def is_pending(self, path: str) -> bool:
+        """Check whether a file is queued but not yet written.
+
+        Args:
+            path: File path passed to submit()
+
+        Returns:
+            bool: True if the write has not completed yet
+        """
+        with self._lock:
+            return path in self._pending
+
+    def has_failed(self, path: str) -> bool:
+        """Check whether the latest write of a file failed.
+
+        Args:
+            path: File path passed to submit()
+
+        Returns:
+            bool: True if the file could not be written
+        """
+        with self._lock:
+            return path in self._failed
+
+    def wait(self, path: str) -> None:
+        """Block until a queued file has been written.
+
+        Returns immediately if the path is not queued.
+
+        Args:
+            path: File path passed to submit()
+
+        Raises:
+            Exception: If the file could not be written
+        """
+        with self._lock:
+            done = self._pending.get(path)
+        if done is not None:
+            done.wait()
+        with self._lock:
+            error = self._errors.pop(path, None)
+            failed = path in self._failed
+        if error is not None:
+            raise error
+        if failed:
+            # The error was already reported by flush()
+            raise OSError(f"Artifact could not be written: {path}")
+
+    def flush(self) -> None:
+        """Block until all queued artifacts have been written.
+
+        Errors of failed writes nobody waited for are dropped after a summary
+        is logged; has_failed() still reports those paths.
+        """
+        self._queue.join()
+        with self._lock:
+            unclaimed = len(self._errors)
+            self._errors.clear()
+        if unclaimed:
+            logger.warning(f"{unclaimed} artifact(s) could not be written, see errors above")
+
+    def _run(self) -> None:
+        """Worker loop writing queued artifacts to disk."""
+        while True:
+            path, data, transform, link_source = self._queue.get()
+            try:
+                if link_source is not None:
+                    try:
+                        # Earlier writes are done, the queue is processed in order
+                        os.link(link_source, path)
+                        logger.debug(f"Artifact linked: {path} -> {link_source}")
+                        continue
+                    except OSError as e:
+                        logger.debug(f"Could not link {path} to {link_source}, writing it: {e}")
+                if transform is not None:
+                    data = transform(data)
+                Path(path).write_bytes(data)
+                logger.debug(f"Artifact written: {path}")
+            except Exception as e:
+                logger.error(f"Failed to write artifact {path}: {e}")
+                with self._lock:
+                    self._errors[path] = e
+                    self._failed.add(path)
+            finally:
+                with self._lock:
+                    done = self._pending.pop(path, None)
+                if done is not None:
+                    done.set()
+                self._queue.task_done()
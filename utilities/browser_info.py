@@ -0,0 +1,82 @@
+"""Detection of installed browser versions.
+
+The version is read from metadata where the platform provides it (Info.plist
+on macOS, the registry on Windows), so the browser is not launched just to
+print its version. Other platforms fall back to running ``<binary> --version``
+for binaries found on the system.
+"""
+import functools
+import logging
+import platform
+import plistlib
+import re
+import shutil
+import subprocess
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['get_chrome_version']
+
+# Chrome executables probed with --version, by OS
+_CHROME_BINARIES = {
+    'Darwin': (
+        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+        'google-chrome',
+    ),
+    'Linux': ('google-chrome', 'google-chrome-stable', 'chromium-browser', 'chromium'),
+    'Windows': (
+        r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+        r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe',
+    ),
+}
+
+# Version sources that can be read without launching Chrome
+_CHROME_INFO_PLIST = '/Applications/Google Chrome.app/Contents/Info.plist'
+_CHROME_REGISTRY_KEY = r'Software\Google\Chrome\BLBeacon'
+
+_VERSION_PATTERN = re.compile(r"\d+(?:\.\d+)+")
+
+
+@functools.lru_cache(maxsize=None)
+def get_chrome_version() -> Optional[str]:
+    """Detect the installed Chrome version.
+
+    The result is cached for the lifetime of the process.
+
+    Returns:
+        Optional[str]: Chrome version (e.g., '120.0.6099.109'), or None if not found
+    """
+    os_name = platform.system()
+    if os_name == 'Darwin':
+        try:
+            with open(_CHROME_INFO_PLIST, 'rb') as f:
+                version = plistlib.load(f).get('CFBundleShortVersionString')
+            if version:
+                return version
+        except (OSError, ValueError):
+            pass
+    elif os_name == 'Windows':
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, _CHROME_REGISTRY_KEY) as key:
+                return winreg.QueryValueEx(key, 'version')[0]
+        except (ImportError, OSError):
+            pass
+
+    for binary in _CHROME_BINARIES.get(os_name, ()):
+        # Only spawn browsers that actually exist
+        binary_path = shutil.which(binary)
+        if binary_path is None:
+            continue
+        try:
+            result = subprocess.run([binary_path, '--version'],
+                                    capture_output=True, text=True, timeout=5)
+        except (subprocess.SubprocessError, OSError):
+            continue
+        match = _VERSION_PATTERN.search(result.stdout)
+        if result.returncode == 0 and match:
+            return match.group(0)
+
+    logger.debug("Could not detect the installed Chrome version")
+    return None
@@ -51,14 +51,14 @@ class ConfigManager:
             ConfigLoadError: If file cannot be loaded
         """
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.info(f"Loaded {description} from {file_path}")
-                    return data
-            else:
-                logger.warning(f"{description} file not found: {file_path}")
-                return {}
+            # Open directly instead of checking existence first (one syscall less)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                logger.info(f"Loaded {description} from {file_path}")
+                return data
+        except FileNotFoundError:
+            logger.warning(f"{description} file not found: {file_path}")
+            return {}
         except json.JSONDecodeError as e:
             error_msg = f"Invalid JSON in {file_path}: {e}"
             logger.error(error_msg)
@@ -1,18 +1,63 @@
 """Driver factory for creating WebDriver instances with unified logic."""
+import functools
+import importlib
+import json
 import logging
 import os
-import subprocess
+import platform
+import re
+import shutil
+import stat
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
-from typing import Dict, Any, Optional
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from typing import Dict, Any, List, Optional, Tuple
 
+from utilities.browser_info import get_chrome_version
 from utilities.exceptions import DriverInitializationError
 
 logger = logging.getLogger(__name__)
 
+# Directory where webdriver-manager caches downloaded drivers, relative to home
+_WDM_DRIVERS_SUBDIR = os.path.join(".wdm", "drivers")
+
+# Browser version probes used to match a cached driver to the installed browser
+_BROWSER_VERSION_PROBES = {
+    "chromedriver": get_chrome_version,
+}
+
+# webdriver-manager classes per driver, imported only when a download is needed
+_DRIVER_MANAGERS = {
+    "chromedriver": ("webdriver_manager.chrome", "ChromeDriverManager"),
+    "geckodriver": ("webdriver_manager.firefox", "GeckoDriverManager"),
+}
+
+_VERSION_DIR_PATTERN = re.compile(r"^v?(\d+(?:\.\d+)+)$")
+
+# Platform directory names webdriver-manager uses under ~/.wdm/drivers/<driver>/,
+# keyed by (platform.system(), normalized architecture). 32-bit Windows drivers
+# also run on 64-bit Windows, and older webdriver-manager releases only fetched those.
+_WDM_PLATFORM_DIRS = {
+    ("Linux", "64"): ("linux64",),
+    ("Linux", "32"): ("linux32",),
+    ("Linux", "arm64"): ("linux-aarch64", "linux_arm64", "linux-arm64"),
+    ("Darwin", "64"): ("mac64", "mac-x64"),
+    ("Darwin", "arm64"): ("mac-arm64", "mac_arm64", "mac64_m1", "mac-aarch64"),
+    ("Windows", "64"): ("win64", "win32"),
+    ("Windows", "32"): ("win32",),
+    ("Windows", "arm64"): ("win64", "win32"),
+}
+
+# Results of webdriver-manager install() calls reused across runs, relative to home
+_INSTALL_CACHE_SUBPATH = os.path.join(".cache", "pytest-selenium-framework", "driver_paths.json")
+_INSTALL_CACHE_TTL = 24 * 60 * 60
+# Serializes load-modify-write cycles on the install cache between threads
+_INSTALL_CACHE_LOCK = threading.Lock()
+
 
 class DriverFactory:
     """Factory class for creating WebDriver instances with smart driver management."""
@@ -21,20 +66,35 @@ class DriverFactory:
     def _check_driver_in_path(driver_name: str) -> bool:
         """Check if driver is available in system PATH.
         
+        Uses a PATH lookup instead of running the driver, so no process is
+        spawned. The driver version is logged from capabilities once started.
+        
         Args:
             driver_name: Name of the driver executable (e.g., 'chromedriver')
             
         Returns:
             bool: True if driver is in PATH, False otherwise
         """
-        try:
-            subprocess.run([driver_name, "--version"],
-                           capture_output=True, check=True, timeout=5)
+        if shutil.which(driver_name):
             logger.debug(f"Found {driver_name} in system PATH")
             return True
-        except (subprocess.SubprocessError, FileNotFoundError, subprocess.TimeoutExpired):
-            logger.debug(f"{driver_name} not found in system PATH, will use webdriver-manager")
-            return False
+        logger.debug(f"{driver_name} not found in system PATH, will use webdriver-manager")
+        return False
+
+    @staticmethod
+    def _stat_or_none(path: str) -> Optional[os.stat_result]:
+        """Stat a path, returning None if it does not exist or is inaccessible.
+        
+        Args:
+            path: Filesystem path to stat
+            
+        Returns:
+            os.stat_result or None
+        """
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
 
     @staticmethod
     def _get_driver_path(driver_manager: Any, driver_name: str) -> str:
@@ -58,31 +118,312 @@ class DriverFactory:
             logger.error(error_msg)
             raise DriverInitializationError(error_msg) from e
 
-        # Determine actual driver executable path
-        if os.path.isdir(driver_path):
+        # Determine actual driver executable path (stat once, reuse below)
+        path_stat = DriverFactory._stat_or_none(driver_path)
+        if path_stat is not None and stat.S_ISDIR(path_stat.st_mode):
             actual_path = os.path.join(driver_path, driver_name)
+            path_stat = DriverFactory._stat_or_none(actual_path)
         elif os.path.basename(driver_path) == driver_name:
             actual_path = driver_path
         else:
             driver_dir = os.path.dirname(driver_path)
             actual_path = os.path.join(driver_dir, driver_name)
+            path_stat = DriverFactory._stat_or_none(actual_path)
 
         # Verify driver exists
-        if not os.path.exists(actual_path):
+        if path_stat is None:
             error_msg = f"Driver executable not found at expected path: {actual_path}"
             logger.error(error_msg)
             raise DriverInitializationError(error_msg)
 
         # Ensure executable permissions
-        if not os.access(actual_path, os.X_OK):
+        if not path_stat.st_mode & 0o111:
             try:
-                os.chmod(actual_path, 0o755)
+                os.chmod(actual_path, stat.S_IMODE(path_stat.st_mode) | 0o755)
                 logger.debug(f"Set executable permissions on {actual_path}")
             except OSError as e:
                 logger.warning(f"Could not set executable permissions on {actual_path}: {e}")
 
         return actual_path
 
+    @staticmethod
+    def _get_browser_major_version(driver_name: str) -> Optional[str]:
+        """Detect the major version of the browser a driver belongs to.
+        
+        Args:
+            driver_name: Name of the driver executable (e.g., 'chromedriver')
+            
+        Returns:
+            Optional[str]: Major version (e.g., '120'), or None if it cannot be detected
+        """
+        probe = _BROWSER_VERSION_PROBES.get(driver_name)
+        version = probe() if probe else None
+        return version.split(".")[0] if version else None
+
+    @staticmethod
+    def _executable_name(driver_name: str) -> str:
+        """Return the platform-specific file name of a driver executable.
+        
+        Args:
+            driver_name: Name of the driver executable (e.g., 'chromedriver')
+            
+        Returns:
+            str: File name, with '.exe' appended on Windows
+        """
+        return f"{driver_name}.exe" if platform.system() == "Windows" else driver_name
+
+    @staticmethod
+    def _wdm_platform_dirs() -> Tuple[str, ...]:
+        """Return the webdriver-manager platform directory names for this machine.
+        
+        Returns:
+            tuple: Directory names (e.g., ('linux64',)), empty for unknown platforms
+        """
+        machine = platform.machine().lower()
+        if machine in ("arm64", "aarch64"):
+            arch = "arm64"
+        elif machine.endswith("64"):
+            arch = "64"
+        else:
+            arch = "32"
+        return _WDM_PLATFORM_DIRS.get((platform.system(), arch), ())
+
+    @staticmethod
+    def _find_cached_driver(driver_name: str) -> Optional[str]:
+        """Look for a driver already downloaded by webdriver-manager.
+        
+        Checking the local cache first avoids the HTTP version lookup that
+        webdriver-manager performs on every install() call. Only drivers built for
+        this OS and architecture are considered, and chromedriver is only reused
+        when its version matches the installed Chrome major version.
+        
+        Args:
+            driver_name: Name of the driver executable (e.g., 'chromedriver')
+            
+        Returns:
+            Optional[str]: Path to the newest compatible cached driver, or None
+        """
+        cache_dir = os.path.join(os.path.expanduser("~"), _WDM_DRIVERS_SUBDIR, driver_name)
+        if not os.path.isdir(cache_dir):
+            return None
+
+        major_version = None
+        if driver_name in _BROWSER_VERSION_PROBES:
+            major_version = DriverFactory._get_browser_major_version(driver_name)
+            if major_version is None:
+                # Cannot verify compatibility, let webdriver-manager decide
+                return None
+
+        executable = DriverFactory._executable_name(driver_name)
+        platform_dirs = DriverFactory._wdm_platform_dirs()
+        candidates = []
+        for root, _dirs, files in os.walk(cache_dir):
+            if executable not in files:
+                continue
+            relative_parts = os.path.relpath(root, cache_dir).split(os.sep)
+            # Skip drivers built for another OS or architecture
+            if relative_parts[0] not in platform_dirs:
+                continue
+            match = next(filter(None, map(_VERSION_DIR_PATTERN.match, relative_parts)), None)
+            if match is None:
+                continue
+            version = match.group(1)
+            if major_version and not version.startswith(f"{major_version}."):
+                continue
+            version_key = tuple(int(part) for part in version.split("."))
+            candidates.append((version_key, os.path.join(root, executable)))
+
+        if not candidates:
+            return None
+        return max(candidates)[1]
+
+    @staticmethod
+    def _create_driver_manager(driver_name: str) -> Any:
+        """Import and instantiate the webdriver-manager class for a driver.
+        
+        webdriver-manager is imported lazily so runs that find drivers in PATH
+        or in the local cache never pay its import cost.
+        
+        Args:
+            driver_name: Name of the driver executable (e.g., 'chromedriver')
+            
+        Returns:
+            webdriver-manager instance (ChromeDriverManager, GeckoDriverManager, etc.)
+        """
+        module_name, class_name = _DRIVER_MANAGERS[driver_name]
+        return getattr(importlib.import_module(module_name), class_name)()
+
+    @staticmethod
+    def _install_cache_file() -> str:
+        """Return the path of the install cache file under the user's home directory."""
+        return os.path.join(os.path.expanduser("~"), _INSTALL_CACHE_SUBPATH)
+
+    @staticmethod
+    def _load_install_cache() -> Dict[str, Dict[str, Any]]:
+        """Load cached webdriver-manager install results.
+        
+        Malformed files and entries are ignored, so a damaged cache never
+        prevents drivers from being created.
+        
+        Returns:
+            dict: Valid cache entries keyed by driver, platform and browser version
+        """
+        try:
+            with open(DriverFactory._install_cache_file(), 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {
+            key: entry for key, entry in cache.items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get("path"), str)
+            and isinstance(entry.get("timestamp"), (int, float))
+            and not isinstance(entry.get("timestamp"), bool)
+        }
+
+    @staticmethod
+    def _write_install_cache(cache: Dict[str, Dict[str, Any]]) -> None:
+        """Write the install cache file.
+        
+        The file is replaced atomically from a uniquely named temporary file,
+        so parallel writers never share a temporary file and readers never see
+        a partially written cache.
+        
+        Args:
+            cache: Cache entries to store
+        """
+        cache_file = DriverFactory._install_cache_file()
+        tmp_path = None
+        try:
+            cache_dir = os.path.dirname(cache_file)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write driver install cache: {e}")
+            if tmp_path is not None and os.path.isfile(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _install_cache_key(driver_name: str) -> str:
+        """Build the install cache key for a driver on this machine.
+        
+        The installed browser's major version is part of the key, so a browser
+        update never reuses a driver installed for the previous version.
+        
+        Args:
+            driver_name: Name of the driver executable (e.g., 'chromedriver')
+            
+        Returns:
+            str: Cache key (e.g., 'chromedriver:Linux:x86_64:120')
+        """
+        parts = [driver_name, platform.system(), platform.machine()]
+        major_version = DriverFactory._get_browser_major_version(driver_name)
+        if major_version:
+            parts.append(major_version)
+        return ":".join(parts)
+
+    @staticmethod
+    def _install_driver(driver_name: str) -> str:
+        """Install a driver via webdriver-manager, reusing recent results.
+        
+        A path recorded within the last 24 hours for the same browser version
+        is returned without calling install(), which avoids webdriver-manager's
+        version lookup over the network. If install() fails (e.g. offline or
+        rate limited), an older cached path for the same browser version is
+        used as a fallback when the executable still exists.
+        
+        Args:
+            driver_name: Name of the driver executable (e.g., 'chromedriver')
+            
+        Returns:
+            str: Path to the driver executable
+            
+        Raises:
+            DriverInitializationError: If driver cannot be installed or found
+        """
+        key = DriverFactory._install_cache_key(driver_name)
+        cache = DriverFactory._load_install_cache()
+        entry = cache.get(key)
+        cached_path = entry["path"] if entry else None
+        cached_usable = bool(cached_path) and os.access(cached_path, os.X_OK)
+
+        if cached_usable and time.time() - entry["timestamp"] < _INSTALL_CACHE_TTL:
+            logger.info(f"Using recently installed {driver_name}: {cached_path}")
+            return cached_path
+
+        try:
+            driver_path = DriverFactory._get_driver_path(
+                DriverFactory._create_driver_manager(driver_name), driver_name)
+        except DriverInitializationError:
+            if cached_usable:
+                logger.warning(f"Falling back to previously installed {driver_name}: {cached_path}")
+                return cached_path
+            raise
+
+        # Reload under the lock so entries written by other threads are kept
+        with _INSTALL_CACHE_LOCK:
+            cache = DriverFactory._load_install_cache()
+            cache[key] = {"path": driver_path, "timestamp": time.time()}
+            DriverFactory._write_install_cache(cache)
+        return driver_path
+
+    @staticmethod
+    def _forget_driver_path(driver_path: str) -> None:
+        """Drop a driver path that failed to start a session from all caches.
+        
+        Clears the per-process resolution memo and removes matching entries
+        from the install cache, so the next driver creation resolves afresh.
+        
+        Args:
+            driver_path: Driver executable path that failed
+        """
+        DriverFactory._resolve_driver_path.cache_clear()
+        with _INSTALL_CACHE_LOCK:
+            cache = DriverFactory._load_install_cache()
+            stale_keys = [key for key, entry in cache.items() if entry["path"] == driver_path]
+            if stale_keys:
+                for key in stale_keys:
+                    del cache[key]
+                DriverFactory._write_install_cache(cache)
+        if stale_keys:
+            logger.info(f"Removed {driver_path} from the driver install cache")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _resolve_driver_path(driver_name: str) -> Optional[str]:
+        """Resolve the driver executable, preferring PATH, then the local driver cache.
+        
+        The result is cached for the lifetime of the process, so only the first
+        driver created per browser pays for PATH, cache and install lookups.
+        Failures are not cached.
+        
+        Args:
+            driver_name: Name of the driver executable (e.g., 'chromedriver')
+            
+        Returns:
+            Optional[str]: Path from webdriver-manager, or None if the driver is in PATH
+            
+        Raises:
+            DriverInitializationError: If driver cannot be installed or found
+        """
+        if DriverFactory._check_driver_in_path(driver_name):
+            return None
+
+        cached_path = DriverFactory._find_cached_driver(driver_name)
+        if cached_path:
+            logger.info(f"Using cached {driver_name} from webdriver-manager: {cached_path}")
+            return cached_path
+
+        return DriverFactory._install_driver(driver_name)
+
     @staticmethod
     def create_driver(browser: str, headless: bool = False,
                       browser_config: Optional[Dict[str, Any]] = None) -> webdriver.Remote:
@@ -113,6 +454,51 @@ class DriverFactory:
             raise ValueError(
                 f"Unsupported browser: {browser}. Supported browsers: chrome, firefox. Edge support coming in next release.")
 
+    @staticmethod
+    def create_drivers_parallel(browsers: List[str], headless: bool = False,
+                                browser_configs: Optional[Dict[str, Dict[str, Any]]] = None
+                                ) -> Dict[str, webdriver.Remote]:
+        """Create WebDriver instances for several browsers concurrently.
+        
+        Args:
+            browsers: Browser names to launch (e.g., ['chrome', 'firefox'])
+            headless: Run in headless mode
+            browser_configs: Optional mapping of browser name to browser-specific configuration
+            
+        Returns:
+            dict: Mapping of browser name to WebDriver instance
+            
+        Raises:
+            ValueError: If a browser is not supported
+            DriverInitializationError: If any driver initialization fails
+        """
+        browser_configs = browser_configs or {}
+        drivers: Dict[str, webdriver.Remote] = {}
+        errors = []
+
+        with ThreadPoolExecutor(max_workers=max(len(browsers), 1)) as executor:
+            futures = {
+                browser: executor.submit(DriverFactory.create_driver, browser, headless,
+                                         browser_configs.get(browser))
+                for browser in browsers
+            }
+            for browser, future in futures.items():
+                try:
+                    drivers[browser] = future.result()
+                except Exception as e:
+                    errors.append(e)
+
+        if errors:
+            # Don't leak browsers that did start when another one failed
+            for driver in drivers.values():
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.warning(f"Error quitting driver after failed parallel launch: {e}")
+            raise errors[0]
+
+        return drivers
+
     @staticmethod
     def _create_chrome_driver(headless: bool, config: Dict[str, Any]) -> webdriver.Chrome:
         """Create Chrome driver with configuration.
@@ -124,6 +510,37 @@ class DriverFactory:
         Returns:
             Chrome WebDriver instance
         """
+        options = DriverFactory._build_chrome_options(headless, config)
+
+        # Try PATH first, then webdriver-manager
+        driver_path = None
+        try:
+            driver_path = DriverFactory._resolve_driver_path("chromedriver")
+            service = ChromeService(driver_path) if driver_path else ChromeService()
+            driver = webdriver.Chrome(service=service, options=options)
+        except Exception as e:
+            if driver_path:
+                # Don't keep handing out a driver that cannot start a session
+                DriverFactory._forget_driver_path(driver_path)
+            error_msg = f"Failed to initialize Chrome driver: {e}"
+            logger.error(error_msg)
+            raise DriverInitializationError(error_msg) from e
+
+        # Configure driver
+        DriverFactory._configure_driver(driver, config)
+        return driver
+
+    @staticmethod
+    def _build_chrome_options(headless: bool, config: Dict[str, Any]) -> webdriver.ChromeOptions:
+        """Build Chrome options from configuration.
+        
+        Args:
+            headless: Run in headless mode
+            config: Browser configuration dict
+            
+        Returns:
+            ChromeOptions instance
+        """
         options = webdriver.ChromeOptions()
 
         if headless:
@@ -142,19 +559,32 @@ class DriverFactory:
             options.add_experimental_option("prefs", prefs)
 
         logger.info(f"Chrome options: {options.arguments}")
+        return options
+
+    @staticmethod
+    def _create_firefox_driver(headless: bool, config: Dict[str, Any]) -> webdriver.Firefox:
+        """Create Firefox driver with configuration.
+        
+        Args:
+            headless: Run in headless mode
+            config: Browser configuration dict
+            
+        Returns:
+            Firefox WebDriver instance
+        """
+        options = DriverFactory._build_firefox_options(headless, config)
 
         # Try PATH first, then webdriver-manager
+        driver_path = None
         try:
-            if DriverFactory._check_driver_in_path("chromedriver"):
-                service = ChromeService()
-                driver = webdriver.Chrome(service=service, options=options)
-            else:
-                driver_path = DriverFactory._get_driver_path(
-                    ChromeDriverManager(), "chromedriver")
-                service = ChromeService(driver_path)
-                driver = webdriver.Chrome(service=service, options=options)
+            driver_path = DriverFactory._resolve_driver_path("geckodriver")
+            service = FirefoxService(driver_path) if driver_path else FirefoxService()
+            driver = webdriver.Firefox(service=service, options=options)
         except Exception as e:
-            error_msg = f"Failed to initialize Chrome driver: {e}"
+            if driver_path:
+                # Don't keep handing out a driver that cannot start a session
+                DriverFactory._forget_driver_path(driver_path)
+            error_msg = f"Failed to initialize Firefox driver: {e}"
             logger.error(error_msg)
             raise DriverInitializationError(error_msg) from e
 
@@ -163,15 +593,15 @@ class DriverFactory:
         return driver
 
     @staticmethod
-    def _create_firefox_driver(headless: bool, config: Dict[str, Any]) -> webdriver.Firefox:
-        """Create Firefox driver with configuration.
+    def _build_firefox_options(headless: bool, config: Dict[str, Any]) -> webdriver.FirefoxOptions:
+        """Build Firefox options from configuration.
         
         Args:
             headless: Run in headless mode
             config: Browser configuration dict
             
         Returns:
-            Firefox WebDriver instance
+            FirefoxOptions instance
         """
         options = webdriver.FirefoxOptions()
 
@@ -192,25 +622,22 @@ class DriverFactory:
                 options.set_preference(pref_key, pref_value)
 
         logger.info(f"Firefox options: {options.arguments}")
+        return options
 
-        # Try PATH first, then webdriver-manager
-        try:
-            if DriverFactory._check_driver_in_path("geckodriver"):
-                service = FirefoxService()
-                driver = webdriver.Firefox(service=service, options=options)
-            else:
-                driver_path = DriverFactory._get_driver_path(
-                    GeckoDriverManager(), "geckodriver")
-                service = FirefoxService(driver_path)
-                driver = webdriver.Firefox(service=service, options=options)
-        except Exception as e:
-            error_msg = f"Failed to initialize Firefox driver: {e}"
-            logger.error(error_msg)
-            raise DriverInitializationError(error_msg) from e
-
-        # Configure driver
-        DriverFactory._configure_driver(driver, config)
-        return driver
+    @staticmethod
+    def _log_versions(driver: webdriver.Remote) -> None:
+        """Log browser and driver versions reported in the session capabilities.
+        
+        Args:
+            driver: WebDriver instance
+        """
+        capabilities = driver.capabilities if isinstance(driver.capabilities, dict) else {}
+        browser_name = capabilities.get("browserName", "browser")
+        browser_version = capabilities.get("browserVersion", "unknown")
+        driver_version = (capabilities.get("chrome", {}).get("chromedriverVersion")
+                          or capabilities.get("moz:geckodriverVersion")
+                          or "unknown")
+        logger.info(f"Started {browser_name} {browser_version} with driver {driver_version.split(' ')[0]}")
 
     @staticmethod
     def _configure_driver(driver: webdriver.Remote, config: Dict[str, Any]) -> None:
@@ -220,6 +647,8 @@ class DriverFactory:
             driver: WebDriver instance to configure
             config: Browser configuration dict
         """
+        DriverFactory._log_versions(driver)
+
         try:
             # Set window size
             window_size = config.get("window_size", {})
@@ -3,21 +3,87 @@
 This module provides a centralized logging setup function that configures
 loggers with both console and file handlers. It prevents duplicate handlers
 and ensures consistent logging format across the framework.
+
+Log records are handed to a background QueueListener so that formatting and
+console/file writes do not block the test thread.
 """
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from typing import Optional
 
 __all__ = ['setup_logger']
 
+# Get project root directory (parent of utilities directory)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_LOGS_DIR = os.path.join(_PROJECT_ROOT, 'logs')
+
+# Formatter shared by every handler created in this module
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_file_handler() -> Optional[logging.FileHandler]:
+    """Create the per-process log file handler on first use.
+    
+    All loggers configured through setup_logger write to this single handler,
+    so a test run produces one timestamped log file instead of one per module.
+    
+    Returns:
+        logging.FileHandler or None if the log file cannot be created
+    """
+    try:
+        log_filename = f'test_run_{datetime.now():%Y%m%d_%H%M%S}.log'
+        file_handler = logging.FileHandler(os.path.join(_LOGS_DIR, log_filename), encoding='utf-8')
+        file_handler.setFormatter(_FORMATTER)
+        return file_handler
+    except (OSError, IOError) as e:
+        # If file handler creation fails, continue with console handler only
+        print(f"Warning: Could not create log file: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_queue_handler() -> logging.handlers.QueueHandler:
+    """Start the background log listener on first use.
+    
+    The listener owns the real console and file handlers; loggers only get a
+    QueueHandler, so a log call is reduced to a queue put.
+    
+    Returns:
+        logging.handlers.QueueHandler feeding the shared listener
+    """
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(_FORMATTER)
+    handlers = [console_handler]
+
+    file_handler = _shared_file_handler()
+    if file_handler:
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Flush pending records before the interpreter exits
+    atexit.register(listener.stop)
+
+    return logging.handlers.QueueHandler(log_queue)
+
 
 def setup_logger(name: Optional[str] = None, level: int = logging.INFO) -> logging.Logger:
     """Set up a logger with the specified name and level.
     
     This function configures a logger with both console and file handlers.
     If the logger already has handlers configured, it will not add duplicate
-    handlers to prevent log message duplication.
+    handlers to prevent log message duplication. Records are written by a
+    background thread via a shared QueueHandler.
     
     Args:
         name: Name of the logger. If None, the root logger is configured.
@@ -28,16 +94,12 @@ def setup_logger(name: Optional[str] = None, level: int = logging.INFO) -> loggi
         
     Note:
         The logs directory is created relative to the project root.
-        Log files are named with timestamps: test_run_YYYYMMDD_HHMMSS.log
+        Log files are named with timestamps: test_run_YYYYMMDD_HHMMSS.log.
+        A single log file is shared by all loggers in the process.
     """
-    # Get project root directory (parent of utilities directory)
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    logs_dir = os.path.join(project_root, 'logs')
-
     # Create logs directory if it doesn't exist
     try:
-        if not os.path.exists(logs_dir):
-            os.makedirs(logs_dir, exist_ok=True)
+        os.makedirs(_LOGS_DIR, exist_ok=True)
     except OSError as e:
         # If directory creation fails, log warning but continue
         # (pytest.ini may handle logging configuration)
@@ -52,32 +114,7 @@ def setup_logger(name: Optional[str] = None, level: int = logging.INFO) -> loggi
 
     logger.setLevel(level)
 
-    # Create formatter (shared between handlers)
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-
-    # Create file handler with timestamp
-    try:
-        log_filename = f'test_run_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-        log_filepath = os.path.join(logs_dir, log_filename)
-        file_handler = logging.FileHandler(log_filepath, encoding='utf-8')
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-    except (OSError, IOError) as e:
-        # If file handler creation fails, continue with console handler only
-        print(f"Warning: Could not create log file: {e}")
-        file_handler = None
-
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    if file_handler:
-        logger.addHandler(file_handler)
+    # Route records through the shared queue to the console and file handlers
+    logger.addHandler(_shared_queue_handler())
 
     return logger
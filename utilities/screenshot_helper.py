@@ -4,26 +4,183 @@ This module provides a centralized class for taking screenshots and attaching
 them to test reports (Allure and HTML). It handles screenshot naming, directory
 creation, and report integration.
 """
-import allure
+import functools
+import hashlib
+import io
+import itertools
 import logging
 import os
-import pytest
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from typing import Optional, Union, Any
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Union, Any
+
+from utilities.async_writer import AsyncArtifactWriter
+
+if TYPE_CHECKING:
+    import allure
 
 logger = logging.getLogger(__name__)
 
+# Get project root directory (parent of utilities directory)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SCREENSHOT_DIR = os.path.join(_PROJECT_ROOT, "reports", "screenshots")
+
+# Filename stamp fixed once per process; the xdist worker id keeps workers apart
+_RUN_STAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
+if os.environ.get("PYTEST_XDIST_WORKER"):
+    _RUN_STAMP = f"{_RUN_STAMP}_{os.environ['PYTEST_XDIST_WORKER']}"
+
+# Set SCREENSHOT_OPTIMIZE=1 to re-encode screenshots as palette PNGs (requires Pillow)
+_OPTIMIZE_PNG = os.environ.get("SCREENSHOT_OPTIMIZE") == "1"
+
 __all__ = ['ScreenshotHelper']
 
+# Report modules are imported on first use so importing this helper stays cheap
+_ALLURE: Any = None
+_HTML_IMAGE: Any = None
+
+
+def _get_allure() -> Any:
+    """Import and cache the allure module on first use."""
+    global _ALLURE
+    if _ALLURE is None:
+        import allure
+        _ALLURE = allure
+    return _ALLURE
+
+
+def _get_html_image() -> Optional[Callable[..., Any]]:
+    """Return pytest_html.extras.image, or None if pytest-html is not installed."""
+    global _HTML_IMAGE
+    if _HTML_IMAGE is None:
+        try:
+            import pytest_html
+            _HTML_IMAGE = pytest_html.extras.image
+        except ImportError:
+            # Remember the miss so the import is not retried on every call
+            _HTML_IMAGE = False
+    return _HTML_IMAGE or None
+
+
+def _optimize_png(png: bytes) -> bytes:
+    """Quantize and re-encode a PNG to reduce its size.
+    
+    Runs on the artifact writer thread. Falls back to the original bytes if
+    Pillow is not installed or the image cannot be processed.
+    
+    Args:
+        png: PNG data from the driver
+        
+    Returns:
+        bytes: Optimized PNG data, or the original data
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        logger.debug("Pillow not available, writing screenshot unoptimized")
+        return png
+
+    try:
+        image = Image.open(io.BytesIO(png))
+        if image.mode in ("RGB", "RGBA"):
+            fast_octree = getattr(Image, "Quantize", Image).FASTOCTREE
+            image = image.quantize(colors=256, method=fast_octree)
+        output = io.BytesIO()
+        image.save(output, format="PNG", optimize=True)
+        return output.getvalue()
+    except Exception as e:
+        logger.warning(f"Could not optimize screenshot, writing original: {e}")
+        return png
+
+
+_DEFAULT_SCREENSHOT_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the shared screenshot capture pool on first use.
+    
+    The pool size can be set with the SCREENSHOT_WORKERS environment variable.
+    Invalid values fall back to the default of 4 workers.
+    """
+    value = os.environ.get("SCREENSHOT_WORKERS")
+    try:
+        max_workers = int(value) if value else _DEFAULT_SCREENSHOT_WORKERS
+        if max_workers < 1:
+            raise ValueError("must be at least 1")
+    except ValueError:
+        logger.warning(f"Invalid SCREENSHOT_WORKERS value {value!r}, "
+                       f"using {_DEFAULT_SCREENSHOT_WORKERS}")
+        max_workers = _DEFAULT_SCREENSHOT_WORKERS
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="screenshot")
+
+
+# Height in pixels of the caption band drawn above each step in a step sheet
+_STEP_CAPTION_HEIGHT = 24
+
+
+def _compose_steps(steps: List[Tuple[str, bytes]]) -> Optional[bytes]:
+    """Stack step screenshots vertically into a single captioned PNG.
+    
+    Args:
+        steps: List of (step name, PNG data) tuples in capture order
+        
+    Returns:
+        bytes: Combined PNG data, or None if Pillow is not installed
+    """
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError:
+        logger.debug("Pillow not available, step screenshots will be attached individually")
+        return None
+
+    images = [(name, Image.open(io.BytesIO(png)).convert("RGB")) for name, png in steps]
+    width = max(image.width for _, image in images)
+    height = sum(image.height + _STEP_CAPTION_HEIGHT for _, image in images)
+
+    sheet = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(sheet)
+    offset = 0
+    for name, image in images:
+        draw.text((4, offset + 4), name, fill="black")
+        offset += _STEP_CAPTION_HEIGHT
+        sheet.paste(image, (0, offset))
+        offset += image.height
+
+    output = io.BytesIO()
+    sheet.save(output, format="PNG")
+    return output.getvalue()
+
 
 class ScreenshotHelper:
     """Helper class for taking screenshots and attaching them to test reports."""
 
+    # Process-wide sequence so filenames stay unique within the same second
+    _counter = itertools.count()
+    # Screenshot directories already created in this process
+    _dirs_created: Set[str] = set()
+    # Screenshot directory for the test currently running in this process, with
+    # a pre-joined separator so filenames are built with one concatenation
+    _dir_prefix: str = _SCREENSHOT_DIR + os.sep
+    # Helpers holding buffered step screenshots, flushed together at test teardown
+    _step_helpers: List["ScreenshotHelper"] = []
+    # Captures started by take_screenshot_async() that have not finished yet
+    _pending_captures: Set["Future[str]"] = set()
+    # Per-driver locks so helpers never send commands to one session concurrently
+    _driver_locks: "weakref.WeakKeyDictionary[Any, threading.Lock]" = weakref.WeakKeyDictionary()
+    _locks_guard = threading.Lock()
+    # Content digest -> path of screenshots already persisted in this process.
+    # Shared by all helpers (each test builds its own), so reruns and repeated
+    # failure/pass captures are linked across tests; guarded by _locks_guard.
+    _seen: Dict[str, str] = {}
+
     def __init__(self, driver: webdriver.Remote):
         """Initialize screenshot helper.
         
@@ -31,18 +188,189 @@ class ScreenshotHelper:
             driver: WebDriver instance
         """
         self.driver = driver
-        # Get project root directory (parent of utilities directory)
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.screenshot_dir = os.path.join(project_root, "reports", "screenshots")
+        self._writer = AsyncArtifactWriter()
+        # Paths written (or queued) by this helper, known to exist without a stat
+        self._written: Set[str] = set()
+        # WebDriverWait instances reused per timeout
+        self._waits: Dict[float, WebDriverWait] = {}
+        # Step screenshots buffered until flush_steps() combines them
+        self._step_buffer: List[Tuple[str, bytes]] = []
+        # Directory set on this helper (with separator), overriding the per-test folder
+        self._own_prefix: Optional[str] = None
 
-        # Create screenshot directory if it doesn't exist
-        try:
-            os.makedirs(self.screenshot_dir, exist_ok=True)
-        except OSError as e:
-            logger.warning(f"Could not create screenshot directory: {e}")
+    @property
+    def screenshot_dir(self) -> str:
+        """Directory new screenshots are saved to.
+        
+        This is the running test's folder unless a directory was assigned to
+        this helper, which then applies to this helper only. Assign None to
+        return to the per-test folder.
+        """
+        return (self._own_prefix or ScreenshotHelper._dir_prefix)[:-len(os.sep)]
+
+    @screenshot_dir.setter
+    def screenshot_dir(self, directory: Optional[str]) -> None:
+        self._own_prefix = os.fspath(directory) + os.sep if directory is not None else None
+
+    @classmethod
+    def set_test_context(cls, nodeid: Optional[str]) -> None:
+        """Route screenshots taken from now on to a per-test folder.
+        
+        The folder is a short, stable hash of the pytest node ID under
+        reports/screenshots/, so each test's artifacts live together. The
+        folder is looked up whenever a file is saved, so helpers that outlive
+        a test (e.g. page objects from class-scoped fixtures) follow along.
+        
+        Args:
+            nodeid: pytest node ID of the running test, or None to use the shared folder
+        """
+        if nodeid is None:
+            directory = _SCREENSHOT_DIR
+        else:
+            folder = hashlib.blake2s(nodeid.encode('utf-8'), digest_size=8).hexdigest()
+            directory = os.path.join(_SCREENSHOT_DIR, folder)
+        cls._dir_prefix = directory + os.sep
+
+    @staticmethod
+    def _driver_lock(driver: webdriver.Remote) -> threading.Lock:
+        """Return the lock guarding screenshot commands sent to a driver.
+        
+        Args:
+            driver: WebDriver instance
+            
+        Returns:
+            threading.Lock shared by all helpers using this driver
+        """
+        with ScreenshotHelper._locks_guard:
+            lock = ScreenshotHelper._driver_locks.get(driver)
+            if lock is None:
+                lock = ScreenshotHelper._driver_locks[driver] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def _ensure_dir(directory: str) -> None:
+        """Create a screenshot directory on first write, once per process.
+        
+        Args:
+            directory: Directory about to receive a file
+        """
+        if directory not in ScreenshotHelper._dirs_created:
+            try:
+                os.makedirs(directory, exist_ok=True)
+                ScreenshotHelper._dirs_created.add(directory)
+            except OSError as e:
+                logger.warning(f"Could not create screenshot directory: {e}")
+
+    @classmethod
+    def _stamp(cls) -> str:
+        """Return a unique stamp for screenshot filenames.
+        
+        Returns:
+            str: Run timestamp followed by a sequence number (e.g. 20250101_120000_000042)
+        """
+        return f"{_RUN_STAMP}_{next(cls._counter):06d}"
+
+    def _build_path(self, prefix: str, name: str, timestamp: str, suffix: str = ".png") -> str:
+        """Build a full artifact path inside this helper's screenshot directory.
+        
+        Args:
+            prefix: Filename prefix (e.g., 'failure_')
+            name: Screenshot or test name
+            timestamp: Unique stamp from _stamp()
+            suffix: Filename suffix including extension
+            
+        Returns:
+            str: Full path to the artifact
+        """
+        return f"{self._own_prefix or ScreenshotHelper._dir_prefix}{prefix}{name}_{timestamp}{suffix}"
+
+    def _persist(self, png: bytes, filepath: str) -> str:
+        """Queue PNG bytes for writing to a file.
+        
+        If identical content was already saved in this process, by any helper
+        and for any test, the new file is hard-linked to the earlier one instead
+        of being encoded and written again, so every event keeps a file under
+        its own name.
+        
+        Args:
+            png: PNG data
+            filepath: Destination path
+            
+        Returns:
+            str: Path of the saved screenshot (always filepath)
+        """
+        digest = hashlib.blake2b(png, digest_size=16).hexdigest()
+        with ScreenshotHelper._locks_guard:
+            existing_path = ScreenshotHelper._seen.setdefault(digest, filepath)
+        if existing_path == filepath:
+            existing_path = None
+        transform = _optimize_png if _OPTIMIZE_PNG else None
+
+        self._ensure_dir(os.path.dirname(filepath))
+        if existing_path is not None:
+            logger.debug(f"Identical screenshot already saved, linking {filepath} to {existing_path}")
+            self._writer.submit(filepath, png, transform, link_source=existing_path)
+        else:
+            self._writer.submit(filepath, png, transform)
+        self._written.add(filepath)
+        return filepath
+
+    def _file_available(self, path: str) -> bool:
+        """Check whether a file exists or will exist once queued writes finish.
+        
+        Paths written by this helper are answered from memory unless their
+        write failed; only unknown paths cost a stat call.
+        
+        Args:
+            path: File path to check
+            
+        Returns:
+            bool: True if the file exists or is queued for writing
+        """
+        if self._writer.is_pending(path):
+            return True
+        if path in self._written:
+            if not self._writer.has_failed(path):
+                return True
+            self._written.discard(path)
+        return os.path.isfile(path)
+
+    def _capture(self, filepath: str) -> Tuple[bytes, str]:
+        """Capture a screenshot in memory and queue it for writing to disk.
+        
+        The file is written by the background AsyncArtifactWriter, so it may
+        not exist yet when this method returns.
+        
+        Args:
+            filepath: Destination path for the PNG file
+            
+        Returns:
+            tuple: PNG data (reusable for report attachments without re-reading
+                the file) and the path the screenshot is saved under
+        """
+        with self._driver_lock(self.driver):
+            png = self.driver.get_screenshot_as_png()
+        return png, self._persist(png, filepath)
+
+    def _wait(self, timeout: float) -> WebDriverWait:
+        """Return a cached WebDriverWait for the given timeout.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            WebDriverWait bound to this helper's driver
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(self.driver, timeout)
+        return wait
 
     def take_screenshot(self, name: Optional[str] = None) -> str:
-        """Take a screenshot and save it with timestamp.
+        """Take a screenshot and save it with a unique run stamp.
+        
+        Unlike the failure and pass screenshots, the file is on disk when this
+        method returns.
         
         Args:
             name: Optional name for the screenshot
@@ -51,20 +379,61 @@ class ScreenshotHelper:
             str: Path to the screenshot file
             
         Raises:
-            Exception: If screenshot cannot be saved
+            Exception: If the screenshot cannot be captured or written
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{name}_{timestamp}.png" if name else f"screenshot_{timestamp}.png"
-        filepath = os.path.join(self.screenshot_dir, filename)
+        filepath = self._build_path("", name or "screenshot", self._stamp())
 
         try:
-            self.driver.save_screenshot(filepath)
+            _, filepath = self._capture(filepath)
+            self._writer.wait(filepath)
             logger.debug(f"Screenshot saved: {filepath}")
             return filepath
         except Exception as e:
             logger.error(f"Failed to save screenshot: {e}")
             raise
 
+    def take_screenshot_async(self, name: Optional[str] = None) -> "Future[str]":
+        """Take a screenshot on a background thread.
+        
+        The WebDriver round-trip runs on a shared thread pool, so the caller can
+        continue with work that does not use the browser while the screenshot
+        is captured. Do not send other commands to the same driver until the
+        future resolves, as Selenium does not guarantee that concurrent use of
+        one session is safe. Captures still running when a test ends are
+        awaited during teardown, before the driver fixture quits the driver.
+        
+        Args:
+            name: Optional name for the screenshot
+            
+        Returns:
+            Future resolving to the path of the screenshot file
+        """
+        future = _get_executor().submit(self.take_screenshot, name)
+        with ScreenshotHelper._locks_guard:
+            ScreenshotHelper._pending_captures.add(future)
+        future.add_done_callback(ScreenshotHelper._capture_done)
+        return future
+
+    @staticmethod
+    def _capture_done(future: "Future[str]") -> None:
+        """Stop tracking a finished asynchronous capture."""
+        with ScreenshotHelper._locks_guard:
+            ScreenshotHelper._pending_captures.discard(future)
+
+    @classmethod
+    def wait_for_captures(cls) -> None:
+        """Block until all captures started with take_screenshot_async() have finished.
+        
+        Failures are logged; callers holding the future still see the exception.
+        """
+        with cls._locks_guard:
+            futures = list(cls._pending_captures)
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Asynchronous screenshot failed: {e}")
+
     def wait_and_take_screenshot(self, by: By, value: str, timeout: int = 10,
                                  name: Optional[str] = None) -> str:
         """Wait for an element to be visible and take a screenshot.
@@ -79,9 +448,8 @@ class ScreenshotHelper:
             str: Path to the screenshot file
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located((by, value))
-            )
+            locator = (by, value)
+            self._wait(timeout).until(EC.visibility_of_element_located(locator))
             return self.take_screenshot(name)
         except TimeoutException:
             logger.debug(f"Element not visible after {timeout}s, taking timeout screenshot")
@@ -98,31 +466,35 @@ class ScreenshotHelper:
         Returns:
             str: Path to the screenshot file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"failure_{test_name}_{timestamp}.png"
-        screenshot_path = os.path.join(self.screenshot_dir, filename)
+        allure = _get_allure()
+        screenshot_path = self._build_path("failure_", test_name, self._stamp())
 
         # Take screenshot
-        self.driver.save_screenshot(screenshot_path)
+        png, screenshot_path = self._capture(screenshot_path)
         logger.info(f"Screenshot saved for failed test: {screenshot_path}")
 
-        # Attach to Allure report
-        self.attach_to_allure(screenshot_path, f"Screenshot - {test_name}",
-                              allure.attachment_type.PNG)
+        # Group the failure attachments under one Allure step
+        with allure.step(f"Failure artifacts - {test_name}"):
+            # Attach to Allure report (from memory, no re-read of the file)
+            self.attach_to_allure(png, f"Screenshot - {test_name}",
+                                  allure.attachment_type.PNG)
 
-        # Save error message if provided
-        if error_msg:
-            try:
-                error_filename = f"failure_{test_name}_{timestamp}_error.txt"
-                error_path = os.path.join(self.screenshot_dir, error_filename)
-                with open(error_path, "w", encoding='utf-8') as f:
-                    f.write(error_msg)
-
-                self.attach_to_allure(error_msg, f"Error Log - {test_name}",
-                                      allure.attachment_type.TEXT)
-                logger.info(f"Error details saved: {error_path}")
-            except Exception as e:
-                logger.warning(f"Failed to save error message: {e}")
+            # Save error message if provided
+            if error_msg:
+                try:
+                    # Encode once for both the log file and the Allure attachment
+                    error_bytes = error_msg.encode('utf-8')
+                    # Pair the log with the screenshot file it belongs to
+                    error_path = f"{os.path.splitext(screenshot_path)[0]}_error.txt"
+                    self._ensure_dir(os.path.dirname(error_path))
+                    self._writer.submit(error_path, error_bytes)
+
+                    self.attach_to_allure(error_bytes, f"Error Log - {test_name}",
+                                          allure.attachment_type.TEXT)
+                    # Written in the background; the writer logs a failed write itself
+                    logger.info(f"Error details queued for saving: {error_path}")
+                except Exception as e:
+                    logger.warning(f"Failed to save error message: {e}")
 
         return screenshot_path
 
@@ -135,22 +507,94 @@ class ScreenshotHelper:
         Returns:
             str: Path to the screenshot file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"pass_{test_name}_{timestamp}.png"
-        screenshot_path = os.path.join(self.screenshot_dir, filename)
+        allure = _get_allure()
+        screenshot_path = self._build_path("pass_", test_name, self._stamp())
 
         # Take screenshot
-        self.driver.save_screenshot(screenshot_path)
+        png, screenshot_path = self._capture(screenshot_path)
         logger.info(f"Screenshot saved for passed test: {screenshot_path}")
 
-        # Attach to Allure report
-        self.attach_to_allure(screenshot_path, f"Screenshot - {test_name} (Passed)",
+        # Attach to Allure report (from memory, no re-read of the file)
+        self.attach_to_allure(png, f"Screenshot - {test_name} (Passed)",
                               allure.attachment_type.PNG)
 
         return screenshot_path
 
+    def buffer_step(self, step_name: str) -> None:
+        """Capture a screenshot for a test step without writing it yet.
+        
+        Buffered steps are combined into one image by flush_steps(). The
+        framework flushes every helper with buffered steps (including those
+        owned by page objects) automatically during test teardown.
+        
+        Args:
+            step_name: Caption for the step
+        """
+        if not self._step_buffer:
+            ScreenshotHelper._step_helpers.append(self)
+        with self._driver_lock(self.driver):
+            png = self.driver.get_screenshot_as_png()
+        self._step_buffer.append((step_name, png))
+        logger.debug(f"Buffered step screenshot: {step_name}")
+
+    def flush_steps(self, test_name: str) -> Optional[str]:
+        """Combine buffered step screenshots into one image and attach it to reports.
+        
+        Without Pillow the steps are attached to Allure individually instead.
+        
+        Args:
+            test_name: Name of the test the steps belong to
+            
+        Returns:
+            str: Path to the combined screenshot, or None if nothing was saved
+        """
+        if not self._step_buffer:
+            return None
+        steps, self._step_buffer = self._step_buffer, []
+        if self in ScreenshotHelper._step_helpers:
+            ScreenshotHelper._step_helpers.remove(self)
+        allure = _get_allure()
+
+        try:
+            sheet = _compose_steps(steps)
+        except Exception as e:
+            logger.warning(f"Could not combine step screenshots: {e}")
+            sheet = None
+
+        if sheet is None:
+            for step_name, png in steps:
+                self.attach_to_allure(png, f"Step - {step_name}", allure.attachment_type.PNG)
+            return None
+
+        sheet_path = self._persist(sheet, self._build_path("steps_", test_name, self._stamp()))
+        logger.info(f"Step screenshots saved for {test_name}: {sheet_path}")
+        self.attach_to_allure(sheet, f"Steps - {test_name}", allure.attachment_type.PNG)
+        return sheet_path
+
+    @classmethod
+    def flush_all_steps(cls, test_name: str) -> List[str]:
+        """Flush buffered step screenshots of every helper in this process.
+        
+        Args:
+            test_name: Name of the test the steps belong to
+            
+        Returns:
+            list: Paths of the combined screenshots that were saved
+        """
+        helpers, cls._step_helpers = cls._step_helpers, []
+        sheet_paths = []
+        for helper in helpers:
+            try:
+                sheet_path = helper.flush_steps(test_name)
+            except Exception as e:
+                logger.error(f"Failed to save step screenshots: {e}")
+                continue
+            if sheet_path:
+                sheet_paths.append(sheet_path)
+        return sheet_paths
+
     def attach_to_allure(self, content: Union[str, bytes], name: str,
-                         attachment_type: allure.attachment_type) -> None:
+                         attachment_type: "allure.attachment_type") -> None:
         """Attach content to Allure report.
         
         This method can attach either file content (from a file path) or
@@ -162,8 +606,11 @@ class ScreenshotHelper:
             attachment_type: Type of attachment (PNG, TEXT, etc.)
         """
         try:
-            # If content is a file path, read the file
-            if isinstance(content, str) and os.path.exists(content):
+            allure = _get_allure()
+            # If content is a file path, read the file (waiting for a queued write)
+            if isinstance(content, str) and self._file_available(content):
+                if self._writer.is_pending(content):
+                    self._writer.flush()
                 with open(content, "rb") as f:
                     file_content = f.read()
                 allure.attach(file_content, name=name, attachment_type=attachment_type)
@@ -189,19 +636,18 @@ class ScreenshotHelper:
             pytest_html.extras.image object if successful, None otherwise
         """
         try:
-            if not os.path.exists(screenshot_path):
+            if not self._file_available(screenshot_path):
                 logger.warning(f"Screenshot file not found: {screenshot_path}")
                 return None
 
             # Check if pytest-html is available
-            try:
-                import pytest_html
-            except ImportError:
+            html_image = _get_html_image()
+            if html_image is None:
                 logger.debug("pytest-html not available, skipping HTML report attachment")
                 return None
 
             # Return the extra object for pytest-html
-            html_extra = pytest_html.extras.image(screenshot_path)
+            html_extra = html_image(screenshot_path)
             logger.debug(f"Attached screenshot to HTML report: {screenshot_path}")
             return html_extra
         except Exception as e: